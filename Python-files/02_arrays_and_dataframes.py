@@ -9,6 +9,7 @@ This file demonstrates concepts covered in the Arrays and Data Frames Statistica
 
 import numpy as np
 import pandas as pd
+from data_helpers import compact_dataframe
 
 # Arrays 
 print("=" * 60)
@@ -95,6 +96,7 @@ data = {
 }
 
 df = pd.DataFrame(data)
+df = compact_dataframe(df)  # Age/Income -> int32
 print("DataFrame:")
 print(df)
 
@@ -155,6 +157,10 @@ housing_data = pd.DataFrame({
     'Population': np.random.randint(1000, 50000, n_houses)
 })
 
+# Store the columns in smaller dtypes that still fit (int64 -> int32)
+housing_data = compact_dataframe(housing_data)
+print(f"Compact dtypes:\n{housing_data.dtypes}")
+
 print(f"Housing data summary:\n{housing_data.describe()}")
 
 # Simple linear regression
@@ -175,6 +181,52 @@ income_example = 50000
 predicted_value = intercept + slope * income_example
 print(f"\nPredicted house value for ${income_example} income: ${predicted_value:.2f}")
 
+# Grouped regression: the same simple regression fitted for every segment at once
+def grouped_linregress(groups, x, y):
+    """
+    Fit y = intercept + slope * x separately within each group.
+    All groups are handled together with np.bincount sums instead of a
+    linregress call per group. Returns a DataFrame indexed by group with
+    slope, intercept, r_squared, p_value, std_err and n (like stats.linregress).
+    Groups with fewer than 3 rows get NaN for the statistics that need them.
+    """
+    keys, idx = np.unique(np.asarray(groups), return_inverse=True)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    k = len(keys)
+
+    n = np.bincount(idx, minlength=k).astype(float)
+    x_mean = np.bincount(idx, weights=x, minlength=k) / n
+    y_mean = np.bincount(idx, weights=y, minlength=k) / n
+    dx = x - x_mean[idx]
+    dy = y - y_mean[idx]
+    sxx = np.bincount(idx, weights=dx * dx, minlength=k)
+    syy = np.bincount(idx, weights=dy * dy, minlength=k)
+    sxy = np.bincount(idx, weights=dx * dy, minlength=k)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        r = np.clip(sxy / np.sqrt(sxx * syy), -1.0, 1.0)
+        df = n - 2
+        df[df <= 0] = np.nan
+        std_err = np.sqrt((1 - r**2) * syy / sxx / df)
+        t_stat = r * np.sqrt(df / ((1.0 - r) * (1.0 + r)))
+        p_value = 2 * stats.t.sf(np.abs(t_stat), df)
+
+    return pd.DataFrame({
+        'slope': slope, 'intercept': intercept, 'r_squared': r**2,
+        'p_value': p_value, 'std_err': std_err, 'n': n.astype(int)
+    }, index=pd.Index(keys, name='group'))
+
+housing_data['Region'] = pd.Categorical(np.random.choice(['North', 'South', 'East', 'West'], n_houses))
+region_fits = grouped_linregress(
+    housing_data['Region'],
+    housing_data['Median_household_income'],
+    housing_data['Median_house_value']
+)
+print(f"\nRegression of house value on income by region:\n{region_fits}")
+
 # Matrix Operations
 print("\n" + "=" * 60)
 print("MATRIX OPERATIONS")
@@ -1,8 +1,65 @@
 # Reading data from CSV
 import pandas as pd
 
-# Read a CSV file into a DataFrame
-data = pd.read_csv("data.csv")
+# Columnar binary cache: parse the CSV once, then memory-map columns on later runs
+import os
+import json
+import numpy as np
+from data_helpers import compact_dataframe
+
+def load_columns_cached(path, columns=None, cache_dir=None):
+    """
+    Return a dict of column name -> numpy array for a CSV file.
+    The first call parses the CSV and saves one .npy file per column in
+    cache_dir (default: '<path>.cache'). Later calls memory-map only the
+    requested columns without copying. The cache is rebuilt whenever the
+    CSV's size or modification time changes. Integer columns are stored as
+    int32 when their values fit (see compact_dataframe).
+    Text columns are stored as fixed-width strings plus a mask of missing
+    values; they are returned as object arrays (with NaN where the CSV had
+    no value) rather than memory-mapped.
+    """
+    cache_dir = cache_dir or path + ".cache"
+    meta_path = os.path.join(cache_dir, "meta.json")
+    st = os.stat(path)
+    source = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+    meta = None
+    if os.path.exists(meta_path):
+        with open(meta_path) as fh:
+            meta = json.load(fh)
+    if meta is None or meta['source'] != source:
+        frame = compact_dataframe(pd.read_csv(path), verbose=False)
+        os.makedirs(cache_dir, exist_ok=True)
+        files, masks = {}, {}
+        for i, name in enumerate(frame.columns):
+            col = frame[name].to_numpy()
+            if col.dtype == object:
+                missing = pd.isna(col)
+                masks[name] = f"col{i}_na.npy"
+                np.save(os.path.join(cache_dir, masks[name]), missing)
+                col = np.where(missing, '', col).astype(str)  # fixed-width strings
+            files[name] = f"col{i}.npy"
+            np.save(os.path.join(cache_dir, files[name]), col)
+        meta = {'source': source, 'files': files, 'masks': masks}
+        with open(meta_path, "w") as fh:
+            json.dump(meta, fh)
+
+    columns = list(meta['files']) if columns is None else columns
+    masks = meta.get('masks', {})
+    out = {}
+    for name in columns:
+        col = np.load(os.path.join(cache_dir, meta['files'][name]), mmap_mode='r')
+        if name in masks:
+            col = np.array(col, dtype=object)
+            col[np.load(os.path.join(cache_dir, masks[name]))] = np.nan
+        out[name] = col
+    return out
+
+# Load the x and y columns (parses data.csv only on the first run)
+cols = load_columns_cached("data.csv", ['x', 'y'])
+data = pd.DataFrame(cols, copy=False)
+print(f"Cached columns: {list(cols)}, rows: {len(cols['x'])}")
 
 # Display the first few rows
 print(data.head())
@@ -29,6 +86,62 @@ model = sm.OLS(y, X).fit()
 # Display model summary
 print(model.summary())
 
+# Streaming (chunked) linear model for CSV files too large for memory
+from scipy import stats
+
+def ols_from_csv_chunks(path, x_cols, y_col, chunksize=1_000_000):
+    """
+    Fit y ~ 1 + x_cols by ordinary least squares, reading the CSV in chunks.
+    The fit is updated one chunk at a time by an incremental QR decomposition:
+    the (p+1) x (p+1) triangular factor R of [X y] is stacked on top of the next
+    chunk and re-factorised, so the file size is limited by disk rather than RAM
+    and no cross-products are formed (which would square the condition number).
+    The mean and sum of squares of y are merged chunk by chunk for the R-squared.
+    Returns a dict with coefficients, standard errors, t/p-values and R-squared
+    (the same quantities as sm.OLS(y, sm.add_constant(X)).fit()).
+    """
+    x_cols = list(x_cols)
+    p = len(x_cols) + 1
+    R = np.zeros((0, p + 1))
+    n = 0
+    y_mean = 0.0
+    y_ss = 0.0   # sum of squared deviations of y from its mean
+
+    for chunk in pd.read_csv(path, usecols=x_cols + [y_col], chunksize=chunksize):
+        yc = chunk[y_col].to_numpy(dtype=float)
+        Zc = np.column_stack([np.ones(len(chunk)), chunk[x_cols].to_numpy(dtype=float), yc])
+        R = np.linalg.qr(np.vstack([R, Zc]), mode='r')
+
+        m = len(yc)
+        chunk_mean = yc.mean()
+        delta = chunk_mean - y_mean
+        y_ss += ((yc - chunk_mean)**2).sum() + delta**2 * n * m / (n + m)
+        y_mean += delta * m / (n + m)
+        n += m
+
+    R_x = R[:p, :p]
+    beta = np.linalg.solve(R_x, R[:p, p])
+    rss = R[p, p]**2
+    df_resid = n - p
+    sigma2 = rss / df_resid
+    R_inv = np.linalg.inv(R_x)          # (X'X)^-1 = R^-1 R^-T
+    std_err = np.sqrt(sigma2 * np.sum(R_inv**2, axis=1))
+    t_values = beta / std_err
+    names = ['const'] + x_cols
+    return {
+        'params': pd.Series(beta, index=names),
+        'bse': pd.Series(std_err, index=names),
+        'tvalues': pd.Series(t_values, index=names),
+        'pvalues': pd.Series(2 * stats.t.sf(np.abs(t_values), df_resid), index=names),
+        'rsquared': 1 - rss / y_ss,
+        'nobs': n,
+    }
+
+stream_fit = ols_from_csv_chunks("data.csv", ['x'], 'y', chunksize=10_000)
+print(stream_fit['params'])  # matches model.params
+print(stream_fit['bse'])     # matches model.bse
+print(f"R-squared: {stream_fit['rsquared']:.4f}")  # matches model.rsquared
+
 # Predict for new x values
 new_x = pd.DataFrame({'x': [2, 5, 8]})
 new_x = sm.add_constant(new_x)
@@ -36,11 +149,61 @@ new_x = sm.add_constant(new_x)
 predictions = model.predict(new_x)
 print(predictions)
 
+# Lightweight model artifact and batch predictor (numpy only at scoring time)
+from concurrent.futures import ThreadPoolExecutor
+
+def save_linear_model(path, params):
+    """
+    Save fitted coefficients (a pandas Series such as model.params) to an .npz file.
+    The artifact holds the coefficient vector and the column names it expects;
+    an intercept is stored under the name 'const'.
+    """
+    np.savez(path, coef=np.asarray(params, dtype=float),
+             columns=np.asarray(params.index, dtype=str))
+
+def load_linear_model(path):
+    """Load a model saved with save_linear_model() as a dict of 'coef' and 'columns'."""
+    with np.load(path) as f:
+        return {'coef': f['coef'], 'columns': f['columns'].tolist()}
+
+def predict_linear(lm, data, block_size=1_000_000, n_jobs=1):
+    """
+    Score a linear model on a mapping of column name -> 1-D array
+    (a dict of numpy arrays, memory-mapped columns or a DataFrame).
+    Rows are processed in blocks of block_size; with n_jobs > 1 the blocks
+    are spread over a thread pool (numpy releases the GIL for the arithmetic).
+    """
+    names = [c for c in lm['columns'] if c != 'const']
+    coef = dict(zip(lm['columns'], lm['coef']))
+    cols = [np.asarray(data[c]) for c in names]
+    n = len(data[next(iter(data))])  # rows, also for an intercept-only model
+    out = np.empty(n)
+
+    def score_block(start):
+        stop = min(start + block_size, n)
+        block = out[start:stop]
+        block[:] = coef.get('const', 0.0)
+        for name, col in zip(names, cols):
+            block += coef[name] * col[start:stop]
+
+    starts = range(0, n, block_size)
+    if n_jobs > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            list(pool.map(score_block, starts))
+    else:
+        for start in starts:
+            score_block(start)
+    return out
+
+save_linear_model("linear_model.npz", model.params)
+lm = load_linear_model("linear_model.npz")
+print(predict_linear(lm, {'x': np.array([2, 5, 8])}))  # same as predictions above
+
 # Plotting Regression Line
 import matplotlib.pyplot as plt
 
 plt.scatter(data['x'], data['y'], label='Data', color='gray')
-plt.plot(data['x'], model.predict(X), color='blue', label='Regression Line')
+plt.plot(data['x'], predict_linear(lm, cols), color='blue', label='Regression Line')
 plt.xlabel('x')
 plt.ylabel('y')
 plt.legend()
@@ -6,12 +6,13 @@ def f(x):
     # This is a simple quadratic function
     return (x - 3)**2 + 2
 
-# Use a scalar minimization over a bounded interval (-10, 10)
-result = minimize_scalar(f, bounds=(-10, 10), method='bounded')
+if __name__ == '__main__':
+    # Use a scalar minimization over a bounded interval (-10, 10)
+    result = minimize_scalar(f, bounds=(-10, 10), method='bounded')
 
-# Display the result
-print(f"Minimum value of f(x): {result.fun}")
-print(f"At x = {result.x}")
+    # Display the result
+    print(f"Minimum value of f(x): {result.fun}")
+    print(f"At x = {result.x}")
 
 ## Numerical Derivative using numDeriv
 import numpy as np
@@ -25,9 +26,10 @@ def grad(f, x, h=1e-6):
     # Central difference approximation
     return (f(x + h) - f(x - h)) / (2 * h)
 
-# Evaluate derivative at x = 3
-gradient_at_3 = grad(f, 3)
-print(f"Gradient at x=3: {gradient_at_3}")
+if __name__ == '__main__':
+    # Evaluate derivative at x = 3
+    gradient_at_3 = grad(f, 3)
+    print(f"Gradient at x=3: {gradient_at_3}")
 
 ## Multivariate Optimization Example
 from scipy.optimize import minimize
@@ -37,15 +39,16 @@ def f(x):
     # x is an array [x1, x2]
     return (x[0] - 1)**2 + (x[1] - 2)**2
 
-# Initial guess
-x0 = [0, 0]
+if __name__ == '__main__':
+    # Initial guess
+    x0 = [0, 0]
 
-# Run optimization
-result = minimize(f, x0)
+    # Run optimization
+    result = minimize(f, x0)
 
-# Display results
-print(f"Minimum value: {result.fun}")
-print(f"Optimal point: {result.x}")
+    # Display results
+    print(f"Minimum value: {result.fun}")
+    print(f"Optimal point: {result.x}")
 
 ## Optimization with gradient information
 import numpy as np
@@ -60,14 +63,89 @@ def grad(x):
     # Analytical gradient (partial derivatives)
     return np.array([2*(x[0]-1), 2*(x[1]-2)])
 
-# Initial guess
-x0 = np.array([0, 0])
+if __name__ == '__main__':
+    # Initial guess
+    x0 = np.array([0, 0])
 
-# Use BFGS algorithm with gradient
-result = minimize(f, x0, method='BFGS', jac=grad)
+    # Use BFGS algorithm with gradient
+    result = minimize(f, x0, method='BFGS', jac=grad)
 
-print(f"Minimum value: {result.fun}")
-print(f"Optimal point: {result.x}")
+    print(f"Minimum value: {result.fun}")
+    print(f"Optimal point: {result.x}")
+
+## Vectorised numerical derivatives
+# All perturbed points are stacked into one array and passed to a vectorised
+# objective in a single call, instead of calling f twice per coordinate.
+# Richardson extrapolation combines steps h and h/2 to cancel the O(h^2)
+# error term of the central difference.
+
+def _evaluate(f, points, vectorized):
+    if vectorized:
+        return np.asarray(f(points), dtype=float).reshape(len(points), -1)
+    return np.array([np.atleast_1d(f(p)) for p in points], dtype=float)
+
+def fd_jacobian(f, x, h=None, richardson=True, vectorized=True):
+    """
+    Jacobian of f at x by central differences, shape (k, d) for f: R^d -> R^k.
+    With vectorized=True, f must accept an (m, d) array of points and return
+    m values (or an (m, k) array); every point is evaluated in one call.
+    """
+    x = np.asarray(x, dtype=float)
+    d = x.size
+    if h is None:
+        h = (1e-3 if richardson else 1e-5) * np.maximum(1.0, np.abs(x))
+    h = np.broadcast_to(np.asarray(h, dtype=float), (d,))
+    steps = np.diag(h)
+    scales = (1.0, 0.5) if richardson else (1.0,)
+    points = np.concatenate([np.concatenate([x + c * steps, x - c * steps]) for c in scales])
+    values = _evaluate(f, points, vectorized)
+
+    estimates = []
+    for i, c in enumerate(scales):
+        block = values[2 * d * i: 2 * d * (i + 1)]
+        estimates.append((block[:d] - block[d:]) / (2 * c * h[:, None]))
+    jac = estimates[0] if not richardson else (4 * estimates[1] - estimates[0]) / 3
+    return jac.T
+
+def fd_gradient(f, x, h=None, richardson=True, vectorized=True):
+    """Gradient of a scalar function f at x (see fd_jacobian); usable as minimize(jac=...)."""
+    return fd_jacobian(f, x, h, richardson, vectorized)[0]
+
+def fd_hessian(f, x, h=None, vectorized=True):
+    """
+    Hessian of a scalar function f at x from the central formula
+    [f(x+hi+hj) - f(x+hi-hj) - f(x-hi+hj) + f(x-hi-hj)] / (4 hi hj),
+    with all 4 * d(d+1)/2 points evaluated in one call.
+    """
+    x = np.asarray(x, dtype=float)
+    d = x.size
+    if h is None:
+        h = 1e-4 * np.maximum(1.0, np.abs(x))
+    h = np.broadcast_to(np.asarray(h, dtype=float), (d,))
+    steps = np.diag(h)
+    pairs = [(i, j) for i in range(d) for j in range(i, d)]
+    signs = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+    points = np.array([x + si * steps[i] + sj * steps[j] for i, j in pairs for si, sj in signs])
+    values = _evaluate(f, points, vectorized)[:, 0].reshape(len(pairs), 4)
+
+    hess = np.empty((d, d))
+    for (i, j), (pp, pm, mp, mm) in zip(pairs, values):
+        hess[i, j] = hess[j, i] = (pp - pm - mp + mm) / (4 * h[i] * h[j])
+    return hess
+
+# Vectorised objective: each row of X is one point
+def f_vec(X):
+    X = np.atleast_2d(X)
+    return (X[:, 0] - 1)**2 + (X[:, 1] - 2)**2
+
+if __name__ == '__main__':
+    print(f"Numerical gradient at (0, 0): {fd_gradient(f_vec, [0, 0])}")   # [-2, -4]
+    print(f"Numerical Hessian at (0, 0):\n{fd_hessian(f_vec, [0, 0])}")     # 2 * identity
+
+    result = minimize(lambda x: f_vec(x)[0], x0, method='BFGS',
+                      jac=lambda x: fd_gradient(f_vec, x))
+    print(f"Minimum value: {result.fun}")
+    print(f"Optimal point: {result.x}")
 
 ## Constrained optimazation
 from scipy.optimize import minimize
@@ -76,17 +154,112 @@ from scipy.optimize import minimize
 def f(x):
     return (x - 3)**2 + 2
 
-# Initial guess
-x0 = [0]
+if __name__ == '__main__':
+    # Initial guess
+    x0 = [0]
+
+    # Bounds for x
+    bounds = [(0, 5)]
+
+    # Minimize using L-BFGS-B (handles box constraints)
+    result = minimize(f, x0, method='L-BFGS-B', bounds=bounds)
+
+    print(f"Minimum value: {result.fun}")
+    print(f"At x = {result.x}")
 
-# Bounds for x
-bounds = [(0, 5)]
+## Caching objective evaluations
+# Line searches and finite-difference gradients often ask for f at a point
+# that was just evaluated, and scipy calls fun and jac separately. Wrapping
+# the objective in a small LRU cache removes the repeated work and records
+# how many evaluations each entry point (fun, jac, fun_and_grad) cost.
+import time
+from collections import OrderedDict
 
-# Minimize using L-BFGS-B (handles box constraints)
-result = minimize(f, x0, method='L-BFGS-B', bounds=bounds)
+class CachedObjective:
+    """
+    Memoizing wrapper for scipy.optimize objectives.
+    Results are cached (LRU, at most maxsize points) on the exact bytes of x.
+    Pass either fun (and optionally grad) or fun_and_grad returning (f, g).
+    Use obj as fun, obj.jac as jac, or obj.fun_and_grad with jac=True.
+    obj.stats holds calls, evaluations, cache hits and seconds per entry point.
+    """
 
-print(f"Minimum value: {result.fun}")
-print(f"At x = {result.x}")
+    def __init__(self, fun=None, grad=None, fun_and_grad=None, maxsize=256):
+        if fun is None and fun_and_grad is None:
+            raise ValueError("give fun or fun_and_grad")
+        self._fun = fun
+        self._grad = grad
+        self._fun_and_grad = fun_and_grad
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self.stats = {}
+
+    def _lookup(self, site, x, need_grad):
+        x = np.asarray(x, dtype=float)
+        key = (x.shape, x.tobytes())
+        record = self.stats.setdefault(site, {'calls': 0, 'evaluations': 0,
+                                              'cache_hits': 0, 'seconds': 0.0})
+        record['calls'] += 1
+        entry = self._cache.get(key)
+        if entry is not None and (not need_grad or 'g' in entry):
+            self._cache.move_to_end(key)
+            record['cache_hits'] += 1
+            return entry
+
+        start = time.perf_counter()
+        entry = dict(entry or {})
+        if self._fun_and_grad is not None:
+            f, g = self._fun_and_grad(x.copy())
+            entry['f'], entry['g'] = f, np.asarray(g, dtype=float)
+        else:
+            if 'f' not in entry:
+                entry['f'] = self._fun(x.copy())
+            if need_grad:
+                if self._grad is None:
+                    raise ValueError("no gradient available for this objective")
+                entry['g'] = np.asarray(self._grad(x.copy()), dtype=float)
+        record['seconds'] += time.perf_counter() - start
+        record['evaluations'] += 1
+
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return entry
+
+    def __call__(self, x):
+        return self._lookup('fun', x, need_grad=False)['f']
+
+    def jac(self, x):
+        return self._lookup('jac', x, need_grad=True)['g']
+
+    def fun_and_grad(self, x):
+        entry = self._lookup('fun_and_grad', x, need_grad=True)
+        return entry['f'], entry['g']
+
+    def report(self):
+        for site, r in self.stats.items():
+            print(f"  {site:>12}: {r['calls']} calls, {r['evaluations']} evaluations, "
+                  f"{r['cache_hits']} cache hits, {r['seconds'] * 1e3:.2f} ms")
+
+if __name__ == '__main__':
+    # Bounded L-BFGS-B with a finite-difference gradient. Re-running the same
+    # fit (e.g. after changing only reporting options) is served from the cache.
+    obj = CachedObjective(lambda x: float((x[0] - 3)**2 + 2))
+    for _ in range(2):
+        result = minimize(obj, [0], method='L-BFGS-B', bounds=[(0, 5)])
+    print(f"Minimum value: {result.fun} at x = {result.x}")
+    obj.report()
+
+# Objective and gradient computed together, requested with jac=True
+def f_and_grad(x):
+    return (x[0] - 1)**2 + (x[1] - 2)**2, np.array([2*(x[0]-1), 2*(x[1]-2)])
+
+if __name__ == '__main__':
+    obj = CachedObjective(fun_and_grad=f_and_grad)
+    result = minimize(obj.fun_and_grad, [0, 0], method='BFGS', jac=True)
+    print(f"Minimum value: {result.fun} at x = {result.x}")
+    obj.report()
 
 ## Non-linear Function Example
 import numpy as np
@@ -96,8 +269,301 @@ from scipy.optimize import minimize_scalar
 def f(x):
     return np.sin(x) + 0.1 * x
 
-# Minimize over interval (-10, 10)
-result = minimize_scalar(f, bounds=(-10, 10), method='bounded')
+if __name__ == '__main__':
+    # Minimize over interval (-10, 10)
+    result = minimize_scalar(f, bounds=(-10, 10), method='bounded')
+
+    print(f"Minimum value: {result.fun}")
+    print(f"At x = {result.x}")
+
+## Multistart optimisation for multimodal functions
+# A single local search finds only one of the minima of sin(x) + 0.1x.
+# Starting from many well-spread points (a Sobol design) in parallel processes
+# and merging the results recovers all of them.
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.optimize import minimize, OptimizeResult
+from scipy.stats import qmc
+
+def _local_minimize(args):
+    fun, x0, method, bounds = args
+    res = minimize(fun, x0, method=method, bounds=bounds)
+    return res.x, float(res.fun), int(res.nfev), bool(res.success)
+
+def multistart_minimize(fun, bounds, n_starts=32, method='L-BFGS-B', design='sobol',
+                        seed=0, n_jobs=None, tol=1e-4):
+    """
+    Run minimize(fun, x0, method, bounds) from n_starts points spread over the
+    box `bounds` (Sobol or Latin hypercube design) in a process pool, then
+    merge starts that converged to the same point (within tol).
+    fun must be picklable (defined at module level).
+    Returns an OptimizeResult with the best x/fun, the distinct `minima`
+    ranked by value, and per-start details in `starts`.
+    """
+    bounds = np.asarray(bounds, dtype=float)
+    d = len(bounds)
+    if design == 'sobol':
+        m = int(np.ceil(np.log2(n_starts)))   # Sobol points come in powers of two
+        unit = qmc.Sobol(d, scramble=True, seed=seed).random_base2(m)[:n_starts]
+    else:
+        unit = qmc.LatinHypercube(d, seed=seed).random(n_starts)
+    x0s = qmc.scale(unit, bounds[:, 0], bounds[:, 1])
+
+    tasks = [(fun, x0, method, bounds) for x0 in x0s]
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        runs = list(pool.map(_local_minimize, tasks))
+
+    starts = [{'x0': x0, 'x': x, 'fun': f, 'nfev': nfev, 'success': ok}
+              for x0, (x, f, nfev, ok) in zip(x0s, runs)]
+    minima = []
+    for s in sorted(starts, key=lambda s: s['fun']):
+        for found in minima:
+            if np.linalg.norm(s['x'] - found['x']) <= tol * (1 + np.linalg.norm(found['x'])):
+                found['count'] += 1
+                found['nfev'] += s['nfev']
+                break
+        else:
+            minima.append({'x': s['x'], 'fun': s['fun'], 'count': 1, 'nfev': s['nfev']})
+
+    best = minima[0]
+    return OptimizeResult(x=best['x'], fun=best['fun'], minima=minima, starts=starts,
+                          nfev=sum(s['nfev'] for s in starts),
+                          success=any(s['success'] for s in starts))
+
+def f_multimodal(x):
+    return np.sin(x[0]) + 0.1 * x[0]
+
+if __name__ == '__main__':
+    result = multistart_minimize(f_multimodal, bounds=[(-10, 10)], n_starts=16)
+    print(f"Global minimum value: {result.fun}")
+    print(f"At x = {result.x}")
+    for m in result.minima:
+        print(f"  local minimum f={m['fun']:.4f} at x={m['x'][0]:.4f} "
+              f"(reached from {m['count']} starts, {m['nfev']} evaluations)")
+
+## Solving many small problems at once
+# For thousands of independent 2-5 parameter fits, the per-call overhead of
+# minimize dominates. Stacking all problems into one (problems x params) array
+# lets every Newton step be a handful of numpy operations for all of them.
+
+def batched_newton(fun, grad, hess, X0, gtol=1e-8, xtol=1e-10, max_iter=100):
+    """
+    Minimise n independent problems together with damped Newton steps
+    (Levenberg-Marquardt damping: solve (H + lam*I) step = -g per problem).
+    If some problem's damped Hessian is singular, that iteration falls back
+    to per-problem solves so the other problems are unaffected.
+    fun(X) -> (m,), grad(X) -> (m, p) and hess(X) -> (m, p, p) receive only the
+    rows of problems that are still running, together with their row indices
+    idx, as fun(X, idx) etc., so per-problem data can be looked up.
+    Returns an OptimizeResult with x (n, p), fun (n,), nit (n,) and status (n,):
+    1 = gradient small, 2 = step small, -1 = max_iter reached, -2 = no progress.
+    """
+    X = np.array(X0, dtype=float)
+    n, p = X.shape
+    idx_all = np.arange(n)
+    f = fun(X, idx_all)
+    lam = np.full(n, 1e-3)
+    status = np.zeros(n, dtype=int)
+    nit = np.zeros(n, dtype=int)
+    eye = np.eye(p)
+
+    for _ in range(max_iter):
+        active = np.flatnonzero(status == 0)
+        if active.size == 0:
+            break
+        xa = X[active]
+        g = grad(xa, active)
+        done = np.max(np.abs(g), axis=1) < gtol
+        status[active[done]] = 1
+        active, xa, g = active[~done], xa[~done], g[~done]
+        if active.size == 0:
+            break
+
+        H = hess(xa, active) + lam[active, None, None] * eye
+        try:
+            step = -np.linalg.solve(H, g[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            # One singular (H + lam*I) fails the whole stacked solve: redo the
+            # problems one at a time, with least squares and more damping
+            # for the singular ones
+            step = np.empty_like(g)
+            for i in range(len(active)):
+                try:
+                    step[i] = -np.linalg.solve(H[i], g[i])
+                except np.linalg.LinAlgError:
+                    step[i] = -np.linalg.lstsq(H[i], g[i], rcond=None)[0]
+                    lam[active[i]] *= 10.0
+        x_new = xa + step
+        f_new = fun(x_new, active)
+        nit[active] += 1
+
+        better = f_new <= f[active]
+        accepted = active[better]
+        X[accepted] = x_new[better]
+        f[accepted] = f_new[better]
+        lam[accepted] = np.maximum(lam[accepted] * 0.3, 1e-12)
+        lam[active[~better]] *= 10.0
+
+        small = better & (np.linalg.norm(step, axis=1) <= xtol * (1 + np.linalg.norm(xa, axis=1)))
+        status[active[small]] = 2
+        status[active[lam[active] > 1e12]] = -2
+
+    status[status == 0] = -1
+    return OptimizeResult(x=X, fun=f, nit=nit, status=status, success=status > 0)
+
+if __name__ == '__main__':
+    # 10,000 Rosenbrock-type problems, each with its own target a_i:
+    #   f_i(x, y) = (a_i - x)^2 + 100 (y - x^2)^2, minimum at (a_i, a_i^2)
+    rng = np.random.default_rng(1)
+    a = rng.uniform(0.5, 1.5, 10_000)
+
+    def rosen_fun(X, idx):
+        return (a[idx] - X[:, 0])**2 + 100 * (X[:, 1] - X[:, 0]**2)**2
+
+    def rosen_grad(X, idx):
+        x, y = X[:, 0], X[:, 1]
+        return np.column_stack([-2 * (a[idx] - x) - 400 * x * (y - x**2), 200 * (y - x**2)])
+
+    def rosen_hess(X, idx):
+        x, y = X[:, 0], X[:, 1]
+        H = np.empty((len(X), 2, 2))
+        H[:, 0, 0] = 2 - 400 * (y - x**2) + 800 * x**2
+        H[:, 0, 1] = H[:, 1, 0] = -400 * x
+        H[:, 1, 1] = 200
+        return H
+
+    start = time.perf_counter()
+    batch = batched_newton(rosen_fun, rosen_grad, rosen_hess, np.tile([-1.2, 1.0], (len(a), 1)))
+    elapsed = time.perf_counter() - start
+    print(f"Solved {batch.success.sum()} of {len(a)} problems in {elapsed:.3f} s "
+          f"(max error {np.max(np.abs(batch.x[:, 0] - a)):.1e}, "
+          f"mean iterations {batch.nit.mean():.1f})")
+
+## Benchmarking optimisation methods
+# Run every method on a set of standard test problems and record what each
+# one costs, so defaults can be chosen from measurements. Results are written
+# to JSON and CSV and compared against a stored baseline to catch regressions.
+import csv
+import json
+import os
+from scipy.optimize import rosen, rosen_der
+
+TEST_PROBLEMS = {
+    'quadratic': {
+        'fun': lambda x: (x[0] - 1)**2 + (x[1] - 2)**2,
+        'grad': lambda x: np.array([2*(x[0]-1), 2*(x[1]-2)]),
+        'x0': np.array([0.0, 0.0]), 'x_star': np.array([1.0, 2.0]), 'f_star': 0.0,
+        'bounds': [(-5, 5), (-5, 5)],
+    },
+    'rosenbrock': {
+        'fun': rosen, 'grad': rosen_der,
+        'x0': np.array([-1.2, 1.0]), 'x_star': np.array([1.0, 1.0]), 'f_star': 0.0,
+        'bounds': [(-2, 2), (-2, 2)],
+    },
+    'multimodal_sin': {
+        'fun': lambda x: np.sin(x[0]) + 0.1 * x[0],
+        'grad': lambda x: np.array([np.cos(x[0]) + 0.1]),
+        'x0': np.array([-1.0]), 'x_star': np.array([-1.6709624]), 'f_star': -1.1620838,
+        'bounds': [(-10, 10)],
+    },
+}
+
+BENCHMARK_METHODS = {
+    'Nelder-Mead': dict(method='Nelder-Mead'),
+    'BFGS (numerical gradient)': dict(method='BFGS'),
+    'BFGS (analytic gradient)': dict(method='BFGS', use_grad=True),
+    'L-BFGS-B (bounds)': dict(method='L-BFGS-B', use_grad=True, use_bounds=True),
+    'bounded (minimize_scalar)': dict(method='bounded', scalar=True),   # 1-D problems only
+}
+
+def run_benchmark(problems=TEST_PROBLEMS, methods=BENCHMARK_METHODS, repeat=5):
+    """
+    Return one result row per (method, problem) with evaluations, time and accuracy.
+    Methods marked scalar run minimize_scalar over the problem's bounds and
+    are skipped for problems with more than one parameter.
+    """
+    rows = []
+    for method_name, spec in methods.items():
+        for problem_name, prob in problems.items():
+            if spec.get('scalar'):
+                if len(prob['x0']) != 1:
+                    continue
+                fun = prob['fun']
+                run = lambda: minimize_scalar(lambda t: fun([t]), bounds=prob['bounds'][0],
+                                              method=spec['method'])
+            else:
+                kwargs = {'method': spec['method']}
+                if spec.get('use_grad'):
+                    kwargs['jac'] = prob['grad']
+                if spec.get('use_bounds'):
+                    kwargs['bounds'] = prob['bounds']
+                run = lambda: minimize(prob['fun'], prob['x0'], **kwargs)
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                res = run()
+                times.append(time.perf_counter() - start)
+            rows.append({
+                'method': method_name, 'problem': problem_name,
+                'success': bool(res.success),
+                'nfev': int(res.nfev), 'njev': int(getattr(res, 'njev', 0) or 0),
+                'nit': int(getattr(res, 'nit', 0) or 0),
+                'seconds': min(times),
+                'f_error': float(abs(res.fun - prob['f_star'])),
+                'x_error': float(np.linalg.norm(np.atleast_1d(res.x) - prob['x_star'])),
+            })
+    return rows
+
+def write_benchmark(rows, path_prefix):
+    """Write benchmark rows to <path_prefix>.json and <path_prefix>.csv."""
+    with open(path_prefix + '.json', 'w') as fh:
+        json.dump(rows, fh, indent=2)
+    with open(path_prefix + '.csv', 'w', newline='') as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def compare_to_baseline(rows, baseline_path, time_ratio=1.5, error_tol=1e-6):
+    """
+    Compare rows with a baseline JSON written by an earlier run. A row is a
+    regression if it needs more evaluations, is more than time_ratio times
+    slower, or lands further than error_tol beyond the baseline's f error.
+    If no baseline exists yet, the current rows are saved as the baseline.
+    """
+    if not os.path.exists(baseline_path):
+        with open(baseline_path, 'w') as fh:
+            json.dump(rows, fh, indent=2)
+        print(f"No baseline found; saved current results to {baseline_path}")
+        return []
+    with open(baseline_path) as fh:
+        baseline = {(r['method'], r['problem']): r for r in json.load(fh)}
+    regressions = []
+    for row in rows:
+        base = baseline.get((row['method'], row['problem']))
+        if base is None:
+            continue
+        reasons = []
+        if row['nfev'] + row['njev'] > base['nfev'] + base['njev']:
+            reasons.append(f"evaluations {base['nfev'] + base['njev']} -> {row['nfev'] + row['njev']}")
+        if row['seconds'] > time_ratio * base['seconds']:
+            reasons.append(f"time {base['seconds']:.2e}s -> {row['seconds']:.2e}s")
+        if row['f_error'] > base['f_error'] + error_tol:
+            reasons.append(f"f error {base['f_error']:.1e} -> {row['f_error']:.1e}")
+        if reasons:
+            regressions.append({'method': row['method'], 'problem': row['problem'],
+                                'reasons': reasons})
+    return regressions
+
+# Set to True to write optimizer_benchmark.json/.csv and check optimizer_baseline.json
+WRITE_BENCHMARK_REPORT = False
 
-print(f"Minimum value: {result.fun}")
-print(f"At x = {result.x}")
+if __name__ == '__main__':
+    benchmark = run_benchmark()
+    print(f"\n{'method':<27}{'problem':<16}{'nfev':>6}{'njev':>6}{'nit':>6}{'ms':>9}{'f error':>10}")
+    for r in benchmark:
+        print(f"{r['method']:<27}{r['problem']:<16}{r['nfev']:>6}{r['njev']:>6}{r['nit']:>6}"
+              f"{r['seconds'] * 1e3:>9.2f}{r['f_error']:>10.1e}")
+    if WRITE_BENCHMARK_REPORT:
+        write_benchmark(benchmark, 'optimizer_benchmark')
+        for reg in compare_to_baseline(benchmark, 'optimizer_baseline.json'):
+            print(f"REGRESSION {reg['method']} on {reg['problem']}: {'; '.join(reg['reasons'])}")
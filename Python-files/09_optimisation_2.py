@@ -1,9 +1,99 @@
+import os
+import re
+import json
+import time
+import hashlib
 import sqlite3
+import queue
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import numpy as np
 import pandas as pd 
 
+
+# --- Connection Pool ---
+class ConnectionPool:
+    """
+    A bounded pool of SQLite connections that can be shared between threads.
+    Each connection keeps a cache of prepared statements (cached_statements),
+    so repeating the same parameterized SQL skips re-parsing, and the pragmas
+    below are applied once when the connection is opened. When all `size`
+    connections are borrowed, a caller waits up to `timeout` seconds for one
+    to be returned before TimeoutError is raised.
+    """
+
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA mmap_size=268435456",   # 256 MB memory-mapped I/O
+        "PRAGMA cache_size=-65536",     # 64 MB page cache
+        "PRAGMA temp_store=MEMORY",
+    )
+
+    def __init__(self, path, size=4, cached_statements=256, timeout=30.0):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False,
+                               cached_statements=self.cached_statements)
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, opening a new one only while fewer than `size` exist."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self.size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    conn = self._open()
+                except sqlite3.Error:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                try:
+                    conn = self._idle.get(timeout=self.timeout)  # wait for one to be returned
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"no connection to {self.path} was returned within {self.timeout} s; "
+                        f"all {self.size} are borrowed (unfinished chunk generators keep theirs)"
+                    ) from None
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        """Close the idle connections; borrowed ones are closed on a later close()."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+
 # --- Database Setup (Connecting to the Database) ---
 try:
-    con = sqlite3.connect("baseball.db")
+    con = ConnectionPool("baseball.db")
+    with con.connection():
+        pass  # open the first connection now so errors show up here
   
 except sqlite3.Error as e:
     print(f"Error connecting to the database: {e}")
@@ -11,12 +101,394 @@ except sqlite3.Error as e:
 
 
 # --- Helper Function for Query Execution ---
-def db_get_query(conn, sql_statement, description):
+@contextmanager
+def borrow_connection(conn):
+    """Yield a raw sqlite3 connection from either a ConnectionPool or a connection."""
+    if isinstance(conn, ConnectionPool):
+        with conn.connection() as c:
+            yield c
+    else:
+        yield conn
+
+
+def _query_chunks(conn, sql_statement, params, chunksize):
+    with borrow_connection(conn) as c:
+        cursor = c.execute(sql_statement, params or ())
+        try:
+            columns = [d[0] for d in cursor.description]
+            yield None  # the statement has run; iter_query_chunks primes up to here
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield pd.DataFrame.from_records(rows, columns=columns)
+        finally:
+            cursor.close()
+
+
+def iter_query_chunks(conn, sql_statement, params=None, chunksize=100_000):
+    """
+    Run a query and return a generator of DataFrames of at most chunksize rows,
+    fetched with cursor.fetchmany, so only one chunk is held in memory at a time.
+    The statement is executed before returning, so SQL errors are raised here
+    rather than when the first chunk is requested.
+    A pooled connection stays borrowed until the generator is exhausted or closed.
+    """
+    chunks = _query_chunks(conn, sql_statement, params, chunksize)
+    next(chunks)
+    return chunks
+
+
+def aggregate_chunks(chunks, by, value_col):
+    """
+    Incrementally compute count, sum, min, max and mean of value_col per
+    group in `by` over an iterable of DataFrame chunks. Only the running
+    per-group totals are kept, so memory depends on the number of groups,
+    not on the number of rows.
+    """
+    totals = None
+    for chunk in chunks:
+        part = chunk.groupby(by)[value_col].agg(['count', 'sum', 'min', 'max'])
+        if totals is None:
+            totals = part
+        else:
+            totals = pd.concat([totals, part]).groupby(level=by).agg(
+                {'count': 'sum', 'sum': 'sum', 'min': 'min', 'max': 'max'})
+    if totals is None:
+        return pd.DataFrame(columns=['count', 'sum', 'min', 'max', 'mean'])
+    totals['mean'] = totals['sum'] / totals['count']
+    return totals
+
+
+# --- Query Result Cache ---
+def install_change_counters(conn, tables):
+    """
+    Create a table_versions table plus triggers that bump a table's version
+    on every INSERT, UPDATE or DELETE, so cached results can be invalidated
+    per table (also for changes made by other processes).
+    """
+    with borrow_connection(conn) as c:
+        c.execute("CREATE TABLE IF NOT EXISTS table_versions "
+                  "(name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0)")
+        for table in tables:
+            c.execute("INSERT OR IGNORE INTO table_versions (name) VALUES (?)", (table,))
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                c.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_version "
+                    f"AFTER {event} ON {table} BEGIN "
+                    f"UPDATE table_versions SET version = version + 1 WHERE name = '{table}'; END"
+                )
+        c.commit()
+
+
+class QueryResultCache:
+    """
+    On-disk LRU cache of query results (one compressed .npz file per result).
+    Entries are keyed on the whitespace-normalized SQL and its parameters and
+    record the versions of the tables the query reads. An entry is dropped
+    as soon as one of those versions moves. Versions come from the
+    table_versions counters (see install_change_counters); without them the
+    database file's size and modification time are used instead.
+    Results with a text column holding anything but strings (SQLite columns
+    can mix types) are returned without being cached, so a hit always has the
+    same values and types as running the query. Last-used times of hits are
+    kept in memory and written to the index with the next insert.
+    """
+
+    def __init__(self, cache_dir=".query_cache", max_entries=128):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path) as fh:
+                self._index = json.load(fh)
+
+    # a quoted string/identifier (kept as is) or a run of whitespace (collapsed)
+    _SQL_TOKEN = re.compile(r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|\s+""")
+
+    @classmethod
+    def make_key(cls, sql_statement, params=None):
+        normalized = cls._SQL_TOKEN.sub(
+            lambda m: m.group() if m.group()[0] in "'\"" else " ",
+            sql_statement.strip().rstrip(";").strip())
+        if isinstance(params, dict):
+            params = sorted(params.items())
+        return hashlib.sha256(repr((normalized, tuple(params or ()))).encode()).hexdigest()
+
+    @staticmethod
+    def table_versions(c, sql_statement):
+        """Current version of each table referenced by sql_statement, or None if unknown."""
+        tables = [name for (name,) in c.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                  if re.search(rf"\b{re.escape(name)}\b", sql_statement, flags=re.I)]
+        try:
+            counters = dict(c.execute("SELECT name, version FROM table_versions"))
+        except sqlite3.OperationalError:
+            counters = {}
+        if all(t in counters for t in tables):
+            return {t: counters[t] for t in tables}
+        path = c.execute("PRAGMA database_list").fetchone()[2]
+        if not path:
+            return None  # in-memory database: nothing stable to compare against
+        stamps = [os.stat(f) for f in (path, path + "-wal") if os.path.exists(f)]
+        return {'__file__': [[st.st_size, st.st_mtime_ns] for st in stamps]}
+
+    @staticmethod
+    def _storable(df):
+        """True if every non-numeric column holds only strings (and missing values)."""
+        for i in range(df.shape[1]):
+            col = df.iloc[:, i]   # by position: a join may repeat a column name
+            if col.dtype.kind not in "biufcmM" and \
+                    not all(isinstance(v, str) for v in col.dropna()):
+                return False
+        return True
+
+    def _save(self, key, df):
+        arrays = {}
+        for i in range(df.shape[1]):
+            col = df.iloc[:, i]
+            if col.dtype.kind in "biufcmM":
+                arrays[f"c{i}"] = col.to_numpy()
+            else:
+                arrays[f"m{i}"] = col.isna().to_numpy()
+                arrays[f"c{i}"] = col.fillna("").astype(str).to_numpy(dtype=str)
+        np.savez_compressed(os.path.join(self.cache_dir, key + ".npz"), **arrays)
+
+    def _load(self, key, columns):
+        data = {}
+        with np.load(os.path.join(self.cache_dir, key + ".npz")) as f:
+            for i in range(len(columns)):
+                values = f[f"c{i}"]
+                if f"m{i}" in f:
+                    values = values.astype(object)
+                    values[f[f"m{i}"]] = None
+                data[i] = values
+        df = pd.DataFrame(data, columns=range(len(columns)))
+        df.columns = columns
+        return df
+
+    def _drop(self, key):
+        self._index.pop(key, None)
+        try:
+            os.remove(os.path.join(self.cache_dir, key + ".npz"))
+        except FileNotFoundError:
+            pass
+
+    def _write_index(self):
+        with open(self._index_path, "w") as fh:
+            json.dump(self._index, fh)
+
+    def fetch(self, c, sql_statement, params=None):
+        """Return the cached result for the query, running it on a miss."""
+        key = self.make_key(sql_statement, params)
+        versions = self.table_versions(c, sql_statement)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is not None and versions is not None and entry['versions'] == versions:
+                entry['last_used'] = time.time()  # saved with the next insert
+                return self._load(key, entry['columns'])
+
+        df = pd.read_sql_query(sql_statement, c, params=params)
+        if versions is None or not self._storable(df):
+            return df
+        with self._lock:
+            self._drop(key)
+            self._save(key, df)
+            self._index[key] = {'columns': [str(col) for col in df.columns],
+                                'versions': versions, 'last_used': time.time()}
+            while len(self._index) > self.max_entries:
+                self._drop(min(self._index, key=lambda k: self._index[k]['last_used']))
+            self._write_index()
+        return df
+
+
+# --- Materialized Aggregates ---
+# (database, source table, group column) ->
+#     {'table': summary table, 'columns': {(FUNC, column): summary column}}
+MATERIALIZED_AGGREGATES = {}
+
+_AGG_ITEM = re.compile(r"^(SUM|COUNT)\s*\(\s*(\w+|\*)\s*\)(?:\s+AS\s+(\w+))?$", re.I)
+_GROUP_QUERY = re.compile(
+    r"^\s*SELECT\s+(.*?)\s+FROM\s+(\w+)\s+GROUP\s+BY\s+(\w+)(?:\s+HAVING\s+(.*?))?\s*;?\s*$",
+    re.I | re.S)
+_QUOTED = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")""")
+
+
+def _sub_outside_quotes(pattern, repl, sql_text, flags=0):
+    """re.sub applied only to the parts of sql_text outside quoted strings/identifiers."""
+    parts = _QUOTED.split(sql_text)   # even items are unquoted, odd items quoted
+    parts[::2] = [re.sub(pattern, repl, part, flags=flags) for part in parts[::2]]
+    return "".join(parts)
+
+
+def _database_key(c):
+    """The database file a connection is attached to (the connection itself if in-memory)."""
+    path = c.execute("PRAGMA database_list").fetchone()[2]
+    return os.path.realpath(path) if path else id(c)
+
+
+def create_materialized_aggregate(conn, summary_table, source_table, group_col, aggregates):
+    """
+    Maintain per-group aggregates of source_table in summary_table.
+    aggregates maps a summary column name to (function, column), where
+    function is 'SUM' or 'COUNT' (COUNT(*) is written ('COUNT', '*')).
+    The summary is filled once and then kept current by INSERT/UPDATE/DELETE
+    triggers, and every aggregate column is indexed so threshold filters
+    (HAVING total > x) become index lookups. A SUM column is NULL for groups
+    with no non-NULL values, as SUM() is.
+    Matching GROUP BY queries are rewritten to read the summary by db_get_query.
+    """
+    def term(row, func, col):
+        if col == "*":
+            return "1"
+        if func.upper() == "COUNT":
+            return f"({row}.{col} IS NOT NULL)"
+        return f"COALESCE({row}.{col}, 0)"
+
+    # Each SUM keeps a count of its non-NULL inputs in _<name>_n and is NULL
+    # while that count is 0, as SUM() over only NULLs is
+    stored = dict(aggregates)
+    sums = {name: col for name, (func, col) in aggregates.items() if func.upper() == "SUM"}
+    for name, col in sums.items():
+        stored[f"_{name}_n"] = ("COUNT", col)
+    names = list(stored)
+    col_defs = ", ".join(f"{name} NUMERIC" if name in sums else f"{name} NUMERIC NOT NULL"
+                         for name in names)
+
+    def upsert(row):
+        values = ", ".join(f"{row}.{sums[name]}" if name in sums else term(row, *stored[name])
+                           for name in names)
+        updates = ", ".join(
+            f"{name} = CASE WHEN excluded.{name} IS NULL THEN {name} "
+            f"ELSE COALESCE({name}, 0) + excluded.{name} END" if name in sums
+            else f"{name} = {name} + excluded.{name}" for name in names)
+        return (f"INSERT INTO {summary_table} ({group_col}, _rows, {', '.join(names)}) "
+                f"VALUES ({row}.{group_col}, 1, {values}) "
+                f"ON CONFLICT({group_col}) DO UPDATE SET _rows = _rows + 1, {updates};")
+
+    def retract(row):
+        updates = ", ".join(
+            f"{name} = CASE WHEN _{name}_n - ({row}.{sums[name]} IS NOT NULL) > 0 "
+            f"THEN {name} - COALESCE({row}.{sums[name]}, 0) END" if name in sums
+            else f"{name} = {name} - {term(row, *stored[name])}" for name in names)
+        return (f"UPDATE {summary_table} SET _rows = _rows - 1, {updates} "
+                f"WHERE {group_col} = {row}.{group_col}; "
+                f"DELETE FROM {summary_table} WHERE {group_col} = {row}.{group_col} AND _rows = 0;")
+
+    with borrow_connection(conn) as c:
+        exists = c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+                           (summary_table,)).fetchone()
+        if not exists:
+            c.execute(f"CREATE TABLE {summary_table} ({group_col} PRIMARY KEY, "
+                      f"_rows INTEGER NOT NULL, {col_defs})")
+            select = ", ".join(f"SUM({source_table}.{sums[name]})" if name in sums
+                               else f"SUM({term(source_table, *stored[name])})" for name in names)
+            c.execute(f"INSERT INTO {summary_table} SELECT {group_col}, COUNT(*), {select} "
+                      f"FROM {source_table} GROUP BY {group_col}")
+            for name in aggregates:
+                c.execute(f"CREATE INDEX {summary_table}_{name} ON {summary_table}({name})")
+        body = {"INSERT": upsert("NEW"), "DELETE": retract("OLD"),
+                "UPDATE": retract("OLD") + " " + upsert("NEW")}
+        for event, statements in body.items():
+            c.execute(f"CREATE TRIGGER IF NOT EXISTS {summary_table}_{event.lower()} "
+                      f"AFTER {event} ON {source_table} BEGIN {statements} END")
+        c.commit()
+        database = _database_key(c)
+
+    MATERIALIZED_AGGREGATES[(database, source_table.lower(), group_col.lower())] = {
+        'table': summary_table,
+        'columns': {(func.upper(), col.lower()): name for name, (func, col) in aggregates.items()},
+    }
+
+
+def rewrite_for_summary(c, sql_statement):
+    """
+    Rewrite 'SELECT g, SUM(x) [AS a] ... FROM t GROUP BY g [HAVING ...]' to
+    read a summary table registered for the database c is connected to,
+    ordered by g as the GROUP BY result is. Queries that do not match a
+    summary exactly, or whose summary table no longer exists, are returned
+    unchanged.
+    """
+    m = _GROUP_QUERY.match(sql_statement)
+    if not m:
+        return sql_statement
+    select_list, source, group_col, having = m.groups()
+    key = (_database_key(c), source.lower(), group_col.lower())
+    summary = MATERIALIZED_AGGREGATES.get(key)
+    if summary is None:
+        return sql_statement
+    if not c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+                     (summary['table'],)).fetchone():
+        del MATERIALIZED_AGGREGATES[key]  # dropped since it was registered
+        return sql_statement
+
+    def summary_column(func, col):
+        key = (func.upper(), col.lower())
+        if key == ("COUNT", "*"):
+            return "_rows"
+        return summary['columns'].get(key)
+
+    items = []
+    aliases = {}
+    for item in select_list.split(","):
+        item = item.strip()
+        if item.lower() == group_col.lower():
+            items.append(group_col)
+            continue
+        agg = _AGG_ITEM.match(item)
+        column = agg and summary_column(agg.group(1), agg.group(2))
+        if not column:
+            return sql_statement
+        if agg.group(3):
+            aliases[agg.group(3)] = column
+            items.append(f"{column} AS {agg.group(3)}")
+        else:
+            items.append(f'{column} AS "{item}"')  # keep the original column name
+
+    rewritten = f"SELECT {', '.join(items)} FROM {summary['table']}"
+    if having:
+        def replace(match):
+            column = summary_column(match.group(1), match.group(2))
+            if column is None:
+                raise KeyError(match.group(0))
+            return column
+        try:
+            having = _sub_outside_quotes(r"(SUM|COUNT)\s*\(\s*(\w+|\*)\s*\)", replace,
+                                         having, flags=re.I)
+        except KeyError:
+            return sql_statement
+        for alias, column in aliases.items():
+            having = _sub_outside_quotes(rf"\b{alias}\b", lambda _, column=column: column, having)
+        rewritten += f" WHERE {having}"
+    return rewritten + f" ORDER BY {group_col}"
+
+
+def db_get_query(conn, sql_statement, description, params=None, chunksize=None,
+                 cache=None):
+    """
+    Run a query and return the result as a DataFrame.
+    conn may be a sqlite3 connection or a ConnectionPool; params are bound to
+    the '?' placeholders so the statement text (and its cached plan) is reused.
+    With chunksize set, return a generator of DataFrame chunks instead
+    (see iter_query_chunks) and print nothing but the description.
+    With a QueryResultCache as cache, unchanged results are read from disk.
+    GROUP BY queries covered by a materialized aggregate read the summary table.
+    """
     if conn:
         print(f"\n--- {description} ---")
         try:
-            # pandas read_sql_query is similar to R's dbGetQuery, returning a DataFrame
-            df = pd.read_sql_query(sql_statement, conn)
+            with borrow_connection(conn) as c:
+                sql_statement = rewrite_for_summary(c, sql_statement)
+            if chunksize:
+                return iter_query_chunks(conn, sql_statement, params, chunksize)
+            with borrow_connection(conn) as c:
+                if cache is not None:
+                    df = cache.fetch(c, sql_statement, params)
+                else:
+                    # pandas read_sql_query is similar to R's dbGetQuery, returning a DataFrame
+                    df = pd.read_sql_query(sql_statement, c, params=params)
             print(df)
             return df
         except Exception as e:
@@ -41,6 +513,14 @@ df_filtered = db_get_query(con,
 )
 
 
+# Example 1b: The same filter with parameters (the prepared statement is cached)
+df_filtered_params = db_get_query(con,
+  "SELECT PlayerID, yearID, AB, H FROM Batting WHERE AB > ? AND H > ?;",
+  "Parameterized filter: AB > 100 AND H > 0",
+  params=(100, 0)
+)
+
+
 # Example 2: Aggregating and Calculating Columns
 df_agg = db_get_query(con, 
   "SELECT MIN(AB), AVG(AB), MAX(AB) FROM Batting;",
@@ -48,6 +528,16 @@ df_agg = db_get_query(con,
 )
 
 
+# Example 2b: The same aggregate through the result cache; reruns read it from
+# disk until the Batting table changes
+result_cache = QueryResultCache(".query_cache")
+df_agg_cached = db_get_query(con,
+  "SELECT MIN(AB), AVG(AB), MAX(AB) FROM Batting;",
+  "Aggregated Stats (cached)",
+  cache=result_cache
+)
+
+
 # Example 3: Calculated Column (Batting Average)
 df_avg = db_get_query(con,
   "SELECT PlayerID, yearID, H/CAST(AB AS REAL) AS BattingAvg FROM Batting ORDER BY BattingAvg DESC LIMIT 3;",
@@ -62,6 +552,19 @@ df_total_salary = db_get_query(con,
 )
 
 
+# Example 4b: Keep per-player salary totals in a trigger-maintained summary table.
+# Set to True to create it in baseball.db; the query above then reads
+# salary_totals through an index instead of scanning Salaries.
+MATERIALIZE_SUMMARIES = False
+if con and MATERIALIZE_SUMMARIES:
+    create_materialized_aggregate(con, "salary_totals", "Salaries", "playerID",
+                                  {'total_salary': ('SUM', 'Salary'), 'seasons': ('COUNT', '*')})
+    df_total_salary = db_get_query(con,
+      "SELECT playerID, SUM(Salary) AS totalSalary FROM Salaries GROUP BY playerID HAVING totalSalary > 30000000;",
+      "Aggregating with GROUP BY and HAVING (materialized summary)"
+    )
+
+
 # Example 5: JOIN (Linking Master and Salaries tables)
 # Using explicit ON clause instead of USING for broader SQL compatibility
 df_join = db_get_query(con, 
@@ -70,6 +573,244 @@ df_join = db_get_query(con,
 )
 
 
+# Example 5b: Streaming the same JOIN in chunks and aggregating as we go
+join_chunks = db_get_query(con,
+  "SELECT nameLast, nameFirst, yearID, Salary FROM Master INNER JOIN Salaries ON Master.playerID = Salaries.playerID;",
+  "Streaming INNER JOIN: salary summary per year",
+  chunksize=50_000
+)
+if join_chunks is not None:
+    print(aggregate_chunks(join_chunks, 'yearID', 'Salary'))
+
+
+# --- Index Advisor ---
+# Queries the report suite runs repeatedly; the advisor checks their plans.
+REPORT_QUERIES = {
+    'batting_filter': "SELECT PlayerID, yearID, AB, H FROM Batting WHERE AB > 100 AND H > 0;",
+    'salary_totals': "SELECT playerID, SUM(Salary) AS totalSalary FROM Salaries GROUP BY playerID HAVING totalSalary > 30000000;",
+    'master_salaries_join': "SELECT nameLast, nameFirst, yearID, Salary FROM Master INNER JOIN Salaries ON Master.playerID = Salaries.playerID;",
+}
+
+_CLAUSE = r"\b{}\b(.*?)(?=\bWHERE\b|\bGROUP\s+BY\b|\bHAVING\b|\bORDER\s+BY\b|\bLIMIT\b|\b(?:INNER|LEFT|CROSS)?\s*JOIN\b|;|$)"
+
+
+def explain_query_plan(conn, sql_statement, params=None):
+    """Return the 'detail' lines of EXPLAIN QUERY PLAN for a query."""
+    with borrow_connection(conn) as c:
+        rows = c.execute("EXPLAIN QUERY PLAN " + sql_statement, params or ()).fetchall()
+    return [row[-1] for row in rows]
+
+
+def propose_indexes(conn, sql_statement):
+    """
+    Look for full table scans, automatic indexes and temp B-trees in the plan
+    of sql_statement and propose one covering index per affected table.
+    Index columns are the table's join/GROUP BY/WHERE/ORDER BY columns first,
+    followed by its other referenced columns so the query never touches the table.
+    Returns a list of (table, [columns]) pairs.
+    """
+    plan = explain_query_plan(conn, sql_statement)
+    flagged = {}  # table -> True if it is the inner side of a join (automatic index)
+    for detail in plan:
+        m = re.match(r"(SCAN|SEARCH) (?:TABLE )?(\w+)(.*)", detail)
+        if not m:
+            continue
+        op, table, rest = m.groups()
+        if "AUTOMATIC" in rest:
+            flagged[table] = True
+        elif op == "SCAN" and "INDEX" not in rest:
+            flagged.setdefault(table, False)
+    if any("TEMP B-TREE" in detail for detail in plan) and not flagged:
+        for table in re.findall(r"\bFROM\s+(\w+)", sql_statement, flags=re.I)[:1]:
+            flagged[table] = False
+
+    def clauses(keywords):
+        found = []
+        for keyword in keywords:
+            found += re.findall(_CLAUSE.format(keyword), sql_statement, flags=re.I | re.S)
+        return found
+
+    filter_clauses = clauses([r"GROUP\s+BY", "WHERE", r"ORDER\s+BY"])
+    join_clauses = clauses(["ON"])
+
+    proposals = []
+    with borrow_connection(conn) as c:
+        for table, join_inner in flagged.items():
+            table_cols = [row[1] for row in c.execute(f"PRAGMA table_info({table})")]
+
+            def mentioned(text):
+                return [col for col in table_cols
+                        if re.search(rf"\b{re.escape(col)}\b", text, flags=re.I)]
+
+            # The driving (outer) table of a join is read in full anyway, so its
+            # join key alone is no reason to index it.
+            keys = []
+            for clause in (join_clauses if join_inner else []) + filter_clauses:
+                keys += [col for col in mentioned(clause) if col not in keys]
+            if not keys:
+                continue  # nothing to search on; an index would still be scanned
+            covering = [col for col in mentioned(sql_statement) if col not in keys]
+            proposals.append((table, keys + covering))
+    return proposals
+
+
+def create_indexes(conn, proposals):
+    """Create the proposed indexes (if missing) and refresh planner statistics."""
+    with borrow_connection(conn) as c:
+        for table, columns in proposals:
+            name = f"idx_{table}_{'_'.join(columns)}"
+            c.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({', '.join(columns)})")
+        c.execute("ANALYZE")
+        c.commit()
+
+
+def time_query(conn, sql_statement, repeat=3):
+    """Best wall time in seconds over `repeat` runs of a query (rows fully fetched)."""
+    best = float("inf")
+    with borrow_connection(conn) as c:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            c.execute(sql_statement).fetchall()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def index_advisor(conn, queries, create=False, repeat=3):
+    """
+    Run the advisor over a dict of name -> SQL. When create is True the
+    proposed indexes are built and each query is timed before and after.
+    Returns a DataFrame with the plan, proposals and timings per query.
+    """
+    report = []
+    for name, sql_statement in queries.items():
+        proposals = propose_indexes(conn, sql_statement)
+        row = {
+            'query': name,
+            'plan': "; ".join(explain_query_plan(conn, sql_statement)),
+            'proposed': "; ".join(f"{t}({', '.join(cols)})" for t, cols in proposals),
+            'before_s': time_query(conn, sql_statement, repeat),
+        }
+        if create and proposals:
+            create_indexes(conn, proposals)
+            row['after_s'] = time_query(conn, sql_statement, repeat)
+            row['plan_after'] = "; ".join(explain_query_plan(conn, sql_statement))
+        report.append(row)
+    return pd.DataFrame(report)
+
+
+# Set to True to build the proposed indexes in baseball.db and compare timings
+CREATE_INDEXES = False
+if con:
+    print("\n--- Index Advisor ---")
+    try:
+        with pd.option_context('display.max_columns', None, 'display.max_colwidth', None, 'display.width', 200):
+            print(index_advisor(con, REPORT_QUERIES, create=CREATE_INDEXES))
+    except sqlite3.Error as e:
+        print(f"Index advisor failed: {e}")
+
+
+# --- Concurrent Queries (asyncio) ---
+class AsyncQueryExecutor:
+    """
+    Run independent read-only queries concurrently from asyncio code.
+    Each worker thread owns one read-only connection to the database file;
+    `await executor.query(sql)` returns a DataFrame. The timeout counts from
+    when a worker starts the query, not while it waits for a free worker; a
+    query that runs past it raises TimeoutError. Overrunning and cancelled
+    queries are stopped by the progress handler or connection.interrupt().
+    """
+
+    def __init__(self, path, max_workers=4):
+        self.path = path
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="sqlite-reader")
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True,
+                                   check_same_thread=False)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _run(self, sql_statement, params, timeout, state):
+        conn = self._connection()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def stop():
+            # Called by SQLite every 10,000 VM instructions; True aborts the query
+            if deadline is not None and time.monotonic() > deadline:
+                state['timed_out'] = True
+            return state['cancelled'] or state['timed_out']
+
+        conn.set_progress_handler(stop, 10_000)
+        try:
+            with state['lock']:
+                if state['cancelled']:
+                    raise sqlite3.OperationalError("interrupted")
+                state['conn'] = conn
+            return pd.read_sql_query(sql_statement, conn, params=params)
+        except Exception:
+            if state['timed_out']:
+                raise TimeoutError(f"query ran longer than {timeout} s") from None
+            raise
+        finally:
+            # The thread's connection moves on to the next query: a late
+            # interrupt() for this one must not reach it
+            with state['lock']:
+                state['conn'] = None
+            conn.set_progress_handler(None, 0)
+
+    async def query(self, sql_statement, params=None, timeout=None):
+        loop = asyncio.get_running_loop()
+        state = {'conn': None, 'cancelled': False, 'timed_out': False,
+                 'lock': threading.Lock()}
+        future = loop.run_in_executor(self._executor, self._run, sql_statement, params,
+                                      timeout, state)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            with state['lock']:
+                state['cancelled'] = True
+                if state['conn'] is not None:
+                    state['conn'].interrupt()
+            raise
+
+    async def run_all(self, queries, timeout=None):
+        """
+        Run a dict of name -> SQL concurrently. Returns name -> DataFrame, or the
+        exception (e.g. TimeoutError) for queries that failed.
+        """
+        results = await asyncio.gather(
+            *(self.query(sql, timeout=timeout) for sql in queries.values()),
+            return_exceptions=True)
+        return dict(zip(queries, results))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+if con:
+    print("\n--- Concurrent report queries ---")
+    executor = AsyncQueryExecutor("baseball.db", max_workers=4)
+    start = time.perf_counter()
+    reports = asyncio.run(executor.run_all(REPORT_QUERIES, timeout=30))
+    executor.close()
+    for name, result in reports.items():
+        shape = result.shape if isinstance(result, pd.DataFrame) else repr(result)
+        print(f"{name}: {shape}")
+    print(f"Wall time: {time.perf_counter() - start:.3f} s")
+
+
 # --- Cleanup ---
 if con:
     con.close()
\ No newline at end of file
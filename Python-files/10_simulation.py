@@ -2,6 +2,7 @@
 
 import sqlite3
 import pandas as pd
+from data_helpers import compact_dataframe, bulk_load
 
 # 1. Connect to an in-memory SQLite database
 # Note: To save to a real file, replace ':memory:' with 'my_database.sqlite'
@@ -21,9 +22,13 @@ patients = pd.DataFrame({
     'Age': [45, 30, 50, 25]
 })
 
-# 2. Write dataframes to the database
-physicians.to_sql('Physicians', conn, index=False)
-patients.to_sql('Patients', conn, index=False)
+# Use compact dtypes (int32, categorical strings) before loading
+physicians = compact_dataframe(physicians)
+patients = compact_dataframe(patients)
+
+# 2. Write dataframes to the database (one transaction, indexes built afterwards)
+bulk_load(conn, physicians, 'Physicians', indexes=[['physicianID']])
+bulk_load(conn, patients, 'Patients', indexes=[['physicianID']])
 
 # --- SQL Queries ---
 
@@ -43,5 +48,79 @@ join_query = """SELECT Patients.Name, Physicians.Name AS Doctor, Physicians.Depa
                 INNER JOIN Physicians ON Patients.physicianID = Physicians.physicianID"""
 print(pd.read_sql_query(join_query, conn))
 
+# --- Out-of-core Join (no database needed) ---
+# The same join for tables too large for memory: both sides arrive as chunks
+# (e.g. pd.read_csv(..., chunksize=...)), are hash-partitioned to disk by key,
+# and are then joined one partition at a time.
+import os
+import tempfile
+import numpy as np
+
+def _spill(chunks, on, n_partitions, out_dir, side, salt):
+    """
+    Write each chunk's rows to per-partition pickle files.
+    Returns (partition -> list of files, an empty frame with the chunk columns).
+    """
+    files = {}
+    schema = None
+    for i, chunk in enumerate(chunks):
+        schema = chunk.iloc[:0] if schema is None else schema
+        hashes = pd.util.hash_pandas_object(chunk[on], index=False, hash_key=salt).to_numpy()
+        part_ids = hashes % np.uint64(n_partitions)
+        for part, rows in chunk.groupby(part_ids, sort=False):
+            path = os.path.join(out_dir, f"{side}_{part}_{i}.pkl")
+            rows.to_pickle(path)
+            files.setdefault(int(part), []).append(path)
+    return files, schema
+
+def _read(paths):
+    return pd.concat([pd.read_pickle(p) for p in paths], ignore_index=True)
+
+def partitioned_join(left_chunks, right_chunks, on, how='inner', n_partitions=16,
+                     memory_budget=256 * 2**20, tmp_dir=None, _depth=0):
+    """
+    Join two chunked tables on column(s) `on` without holding either in memory.
+    Both sides are hash-partitioned to temporary files, then each partition's
+    right side is loaded and the left side is streamed against it, one spilled
+    left chunk at a time, with DataFrame.merge (how='inner' or 'left'). Any
+    partition whose right side is larger than memory_budget bytes is split
+    again with a new hash. Yields the joined rows as DataFrame chunks.
+    The key columns must have the same dtype on both sides. For a left join
+    with no right rows at all the left rows are yielded unchanged, as the
+    right side's columns are unknown.
+    """
+    if how not in ('inner', 'left'):
+        raise ValueError("how must be 'inner' or 'left'")
+    salt = f"partition{_depth:07d}"  # hash_key must be 16 characters
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as out_dir:
+        left_files, _ = _spill(left_chunks, on, n_partitions, out_dir, "left", salt)
+        right_files, right_schema = _spill(right_chunks, on, n_partitions, out_dir, "right", salt)
+        for part, left_paths in left_files.items():
+            right_paths = right_files.get(part, [])
+            if not right_paths:
+                if how == 'left':
+                    for path in left_paths:
+                        left = pd.read_pickle(path)
+                        yield left if right_schema is None else left.merge(right_schema, on=on, how='left')
+                continue
+            right_bytes = sum(os.path.getsize(p) for p in right_paths)
+            if right_bytes > memory_budget and _depth < 3:
+                yield from partitioned_join(
+                    (pd.read_pickle(p) for p in left_paths),
+                    (pd.read_pickle(p) for p in right_paths),
+                    on, how, n_partitions, memory_budget, out_dir, _depth + 1)
+                continue
+            right = _read(right_paths)
+            for path in left_paths:
+                yield pd.read_pickle(path).merge(right, on=on, how=how)
+
+patient_chunks = [patients.iloc[i:i + 2] for i in range(0, len(patients), 2)]
+physician_chunks = [physicians.iloc[i:i + 2] for i in range(0, len(physicians), 2)]
+joined = pd.concat(partitioned_join(patient_chunks, physician_chunks, on='physicianID',
+                                    how='left', n_partitions=4, memory_budget=1024),
+                   ignore_index=True)
+print("\n--- Out-of-core LEFT JOIN (Patients -> Physicians) ---")
+print(joined.sort_values('patientID', ignore_index=True))
+
 # Close connection
 conn.close()
\ No newline at end of file
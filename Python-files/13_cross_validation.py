@@ -11,6 +11,8 @@ import matplotlib.pyplot as plt
 
 # (DATA)
 # The original slides used the 'lidar' dataset. If you have the actual CSV, load it with pd.read_csv.
+# For large CSVs, load_columns_cached() from 06_getting_data_and_linear_models.py parses the file
+# once and memory-maps the 'range' and 'logratio' columns on later runs.
 # For a standalone example we simulate a lidar-like relationship.
 np.random.seed(123)
 n = 200
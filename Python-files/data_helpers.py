@@ -0,0 +1,84 @@
+"""
+Helpers shared by several of the example scripts.
+The scripts' file names start with a digit, so they cannot import each
+other; anything they have in common lives here instead:
+
+    from data_helpers import compact_dataframe, bulk_load
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Store the columns in the smallest dtypes that fit (int64 -> int32, strings -> category)
+def compact_dataframe(df, max_category_ratio=0.5, min_int_bits=32, verbose=True):
+    """
+    Return a copy of df using smaller dtypes that still hold its values:
+    integer columns are downcast to the smallest signed type of at least
+    min_int_bits bits (unsigned types are never used, so subtracting two
+    columns cannot wrap around), and string columns with few distinct values
+    (unique/rows <= max_category_ratio) become 'category'.
+    Prints memory usage before and after when verbose.
+    """
+    out = df.copy()
+    for name in out.columns:
+        col = out[name]
+        if not len(col):
+            continue
+        if pd.api.types.is_integer_dtype(col) and isinstance(col.dtype, np.dtype):
+            lo, hi = col.min(), col.max()
+            for dtype in (np.int8, np.int16, np.int32, np.int64):
+                info = np.iinfo(dtype)
+                if info.bits >= min_int_bits and info.min <= lo and hi <= info.max:
+                    out[name] = col.astype(dtype)
+                    break
+        elif pd.api.types.is_object_dtype(col) or pd.api.types.is_string_dtype(col):
+            if col.nunique() / len(col) <= max_category_ratio:
+                out[name] = col.astype('category')
+    if verbose:
+        before = df.memory_usage(deep=True).sum()
+        after = out.memory_usage(deep=True).sum()
+        print(f"Memory usage: {before:,} -> {after:,} bytes")
+    return out
+
+
+def bulk_load(conn, df, table, batch_size=100_000, indexes=()):
+    """
+    Load a DataFrame into a new SQLite table: rows are inserted with
+    executemany in batches inside one transaction, with synchronous and
+    journal_mode relaxed for the duration of the load, and the indexes
+    (a list of column lists) are created after the data is in.
+    A transaction already open on conn is committed first.
+    df.to_sql also batches executemany, so the gain is small: for 1M rows of
+    int/float/text it took 1.0-1.1 s against 1.2-1.3 s for to_sql, and
+    1.4-1.5 s against 1.6-2.0 s when an index is built as well.
+    """
+    sql_types = {'i': 'INTEGER', 'u': 'INTEGER', 'b': 'INTEGER', 'f': 'REAL'}
+    columns = ", ".join(f'"{name}" {sql_types.get(df[name].dtype.kind, "TEXT")}'
+                        for name in df.columns)
+    placeholders = ", ".join("?" * len(df.columns))
+    # numpy/categorical values -> plain Python objects that sqlite3 understands
+    values = [df[name].astype(object).to_numpy() if df[name].dtype.kind not in 'iubf'
+              else df[name].to_numpy() for name in df.columns]
+
+    if conn.in_transaction:
+        conn.commit()  # the pragmas below cannot be changed inside a transaction
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    try:
+        conn.execute(f'CREATE TABLE "{table}" ({columns})')
+        conn.execute("BEGIN")
+        for start in range(0, len(df), batch_size):
+            batch = [col[start:start + batch_size].tolist() for col in values]
+            conn.executemany(f'INSERT INTO "{table}" VALUES ({placeholders})', zip(*batch))
+        for cols in indexes:
+            conn.execute(f'CREATE INDEX "{table}_{"_".join(cols)}" ON "{table}" ({", ".join(cols)})')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        conn.execute(f"PRAGMA synchronous={synchronous}")